@@ -1,24 +1,71 @@
 from flask import Flask, render_template, jsonify
+from flask.json.provider import JSONProvider
 from flask_sqlalchemy import SQLAlchemy
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 import os
 
 from models import db
 from models.calculation import Calculation
 from routes.calculator_routes import calculator_bp
 from routes.history_routes import history_bp
+from utils.db_writer import CalculationWriter
 
-def create_app():
+_PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_DB = 'sqlite:///' + os.path.join(_PROJECT_DIR, 'calculator.db')
+
+@event.listens_for(Engine, 'connect')
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune SQLite for the write-heavy /calculate path.
+
+    WAL mode allows concurrent readers during writes, and
+    synchronous=NORMAL skips the fsync-per-commit that dominates
+    latency with the default journal mode.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.close()
+
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson.
+
+    Serializes datetime objects natively (treating naive timestamps as
+    UTC), so response building skips both stdlib json and per-row
+    isoformat() calls.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+def create_app(test_config=None):
     app = Flask(__name__)
-    
+    app.json = ORJSONProvider(app)
+
     # Default configuration
-    project_dir = os.path.dirname(os.path.abspath(__file__))
-    default_db = 'sqlite:///' + os.path.join(project_dir, 'calculator.db')
     app.config.from_mapping(
         SECRET_KEY='calculator-secret-key-2024',
-        SQLALCHEMY_DATABASE_URI=default_db,
+        SQLALCHEMY_DATABASE_URI=_DEFAULT_DB,
         SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        # Keep a pool of warm connections so requests don't reopen the
+        # SQLite file; the write-behind thread needs check_same_thread off
+        SQLALCHEMY_ENGINE_OPTIONS={
+            'poolclass': QueuePool,
+            'pool_size': 10,
+            'max_overflow': 20,
+            'connect_args': {'check_same_thread': False},
+        },
     )
 
+    if test_config:
+        app.config.from_mapping(test_config)
+
     # Initialize extensions
     db.init_app(app)
 
@@ -26,6 +73,9 @@ def create_app():
     with app.app_context():
         db.create_all()
 
+    # Batch calculation inserts instead of committing per request
+    app.calculation_writer = CalculationWriter(app, db)
+
     # Register blueprints
     app.register_blueprint(calculator_bp, url_prefix='/api/calculator')
     app.register_blueprint(history_bp, url_prefix='/api/history')
@@ -70,5 +120,6 @@ def register_error_handlers(app):
 
 if __name__ == '__main__':
     app = create_app()
-    # Use port 5000 by default
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Development server only; in production run via wsgi.py behind
+    # gunicorn (see README)
+    app.run(host='0.0.0.0', port=5000)
@@ -1,3 +1,5 @@
 from flask_sqlalchemy import SQLAlchemy
 
-db = SQLAlchemy()
\ No newline at end of file
+db = SQLAlchemy()
+
+from models.calculation import Calculation
\ No newline at end of file
@@ -3,11 +3,22 @@ from models import db
 
 class Calculation(db.Model):
     __tablename__ = 'calculations'
-    
+    __table_args__ = (
+        # Covering index for /api/history/: leads with the filter and
+        # sort columns and holds every column the query selects, so
+        # SQLite answers it without touching the table; its session_id
+        # prefix also serves the DELETE ... WHERE session_id=? in /clear
+        db.Index('ix_calc_cover', 'session_id', 'timestamp', 'id',
+                 'expression', 'result', 'timestamp_iso', 'error_message'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     expression = db.Column(db.String(500), nullable=False)
     result = db.Column(db.String(100), nullable=False)
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
+    # ISO form of timestamp, precomputed at insert so reads skip the
+    # per-row datetime conversion
+    timestamp_iso = db.Column(db.String(32), nullable=False, index=True)
     session_id = db.Column(db.String(100), nullable=False)
     error_message = db.Column(db.String(200), nullable=True)
     
@@ -16,7 +27,7 @@ class Calculation(db.Model):
             'id': self.id,
             'expression': self.expression,
             'result': self.result,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp_iso,
             'session_id': self.session_id,
             'error_message': self.error_message
         }
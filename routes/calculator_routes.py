@@ -1,8 +1,9 @@
-from flask import Blueprint, request, jsonify
-from utils.calculator_core import Calculator
+from flask import Blueprint, current_app, request, jsonify
+from utils.calculator_core import evaluate
 from utils.validators import validate_expression
 from models import db
 from models.calculation import Calculation
+from datetime import datetime
 import uuid
 
 calculator_bp = Blueprint('calculator', __name__)
@@ -13,38 +14,45 @@ def calculate():
     try:
         data = request.get_json()
         expression = data.get('expression', '').strip()
-        session_id = request.headers.get('X-Session-ID') or str(uuid.uuid4())
-        
+        session_id = request.headers.get('X-Session-ID')
+
         # Validate expression
-        if not validate_expression(expression):
+        is_valid, normalized = validate_expression(expression)
+        if not is_valid:
             return jsonify({
                 'error': 'Invalid expression',
                 'message': 'Expression contains invalid characters or syntax'
             }), 400
-        
-        # Perform calculation
-        calculator = Calculator()
-        result = calculator.evaluate(expression)
-        
+
+        # Perform calculation on the already-normalized expression
+        result = evaluate(normalized, normalized=True)
+
+        # Generate a session id only once the calculation succeeded;
+        # uuid4 costs an os.urandom syscall, wasted on 400 responses
+        if not session_id:
+            session_id = str(uuid.uuid4())
+
         # Store in database
+        now = datetime.utcnow()
         calculation = Calculation(
             expression=expression,
             result=str(result),
+            timestamp=now,
+            timestamp_iso=now.isoformat(),
             session_id=session_id
         )
-        db.session.add(calculation)
-        db.session.commit()
+        current_app.calculation_writer.enqueue(calculation)
         
         return jsonify({
             'expression': expression,
-            'result': result,
+            'result': str(result),
             'session_id': session_id
         })
-        
+
     except ZeroDivisionError:
         return jsonify({
             'error': 'Division by zero',
-            'message': 'Cannot divide by zero'
+            'message': 'Division by zero is not allowed'
         }), 400
         
     except ValueError as e:
@@ -65,7 +73,7 @@ def validate_expression_route():
     data = request.get_json()
     expression = data.get('expression', '').strip()
     
-    is_valid = validate_expression(expression)
+    is_valid, _ = validate_expression(expression)
     return jsonify({
         'expression': expression,
         'is_valid': is_valid
@@ -1,4 +1,5 @@
 from flask import Blueprint, request, jsonify
+from sqlalchemy import delete, select
 from models import db
 from models.calculation import Calculation
 
@@ -13,20 +14,36 @@ def get_history():
     if not session_id:
         return jsonify({'error': 'Session ID required'}), 400
     
-    calculations = Calculation.query.filter_by(session_id=session_id)\
-                                  .order_by(Calculation.timestamp.desc())\
-                                  .limit(limit)\
-                                  .all()
-    
-    return jsonify([calc.to_dict() for calc in calculations])
+    # Select plain columns instead of materializing ORM objects; the
+    # history response doesn't need instrumented instances
+    stmt = select(
+        Calculation.id,
+        Calculation.expression,
+        Calculation.result,
+        Calculation.timestamp_iso,
+        Calculation.session_id,
+        Calculation.error_message,
+    ).where(Calculation.session_id == session_id)\
+     .order_by(Calculation.timestamp.desc())\
+     .limit(limit)
+    rows = db.session.execute(stmt).all()
+
+    return jsonify([{
+        'id': row.id,
+        'expression': row.expression,
+        'result': row.result,
+        'timestamp': row.timestamp_iso,
+        'session_id': row.session_id,
+        'error_message': row.error_message
+    } for row in rows])
 
 @history_bp.route('/<int:calc_id>', methods=['DELETE'])
 def delete_calculation(calc_id):
     """Delete specific calculation from history"""
-    calculation = Calculation.query.get(calc_id)
-    if calculation:
-        db.session.delete(calculation)
-        db.session.commit()
+    # One DELETE statement instead of a SELECT + DELETE round-trip pair
+    res = db.session.execute(delete(Calculation).where(Calculation.id == calc_id))
+    db.session.commit()
+    if res.rowcount:
         return jsonify({'message': 'Calculation deleted successfully'})
-    
+
     return jsonify({'error': 'Calculation not found'}), 404
\ No newline at end of file
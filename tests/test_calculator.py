@@ -1,5 +1,6 @@
 import pytest
 import json
+from sqlalchemy.pool import StaticPool
 from app import create_app, db
 from models import Calculation
 
@@ -8,6 +9,11 @@ def client():
     app = create_app({
         'TESTING': True,
         'SQLALCHEMY_DATABASE_URI': 'sqlite:///:memory:',
+        # StaticPool keeps the :memory: database alive across connections
+        'SQLALCHEMY_ENGINE_OPTIONS': {
+            'poolclass': StaticPool,
+            'connect_args': {'check_same_thread': False},
+        },
     })
 
     with app.app_context():
@@ -50,6 +56,31 @@ def test_calculator_basic_operations(client):
     data = response.get_json()
     assert data['result'] == '5'
 
+def test_calculator_complex_expressions(client):
+    """Test precedence, parentheses and unary minus"""
+    cases = [
+        ('(2+3)*4', '20'),
+        ('2+3*4', '14'),
+        ('-2*3', '-6'),
+        ('2*-3', '-6'),
+    ]
+    for expression, expected in cases:
+        response = client.post('/api/calculator/calculate',
+                              json={'expression': expression},
+                              headers={'X-Session-ID': 'test-session-complex'})
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data['result'] == expected
+
+def test_calculator_division_by_zero_in_subexpression(client):
+    """Test division by zero arising inside a sub-expression"""
+    response = client.post('/api/calculator/calculate',
+                          json={'expression': '10/(5-5)'},
+                          headers={'X-Session-ID': 'test-session-complex'})
+    assert response.status_code == 400
+    data = response.get_json()
+    assert 'Division by zero' in data['message']
+
 def test_calculator_division_by_zero(client):
     """Test division by zero error handling"""
     response = client.post('/api/calculator/calculate', 
@@ -0,0 +1,73 @@
+# cython: language_level=3
+"""Optional C accelerator for the two-operand fast path.
+
+Build in place with:
+
+    pip install cython
+    cythonize -i utils/_calculator_core.pyx
+
+calculator_core falls back to the pure-Python implementation when the
+compiled module is absent.
+"""
+from libc.stdlib cimport strtod
+
+
+cdef bint _is_number(const char* s, Py_ssize_t start, Py_ssize_t stop):
+    """C twin of calculator_core._is_number (\\d*\\.?\\d+)"""
+    cdef bint seen_dot = False
+    cdef Py_ssize_t i
+    if stop <= start or not (c'0' <= s[stop - 1] <= c'9'):
+        return False
+    for i in range(start, stop):
+        if s[i] == c'.':
+            if seen_dot:
+                return False
+            seen_dot = True
+        elif not (c'0' <= s[i] <= c'9'):
+            return False
+    return True
+
+
+def evaluate_simple(str expr):
+    """Evaluate a whitespace-free "number op number" expression.
+
+    Returns the result as a float, or None when the expression is not of
+    that simple form (caller falls back to the full evaluator).
+    """
+    cdef bytes data
+    cdef const char* s
+    cdef char* end
+    cdef char op
+    cdef Py_ssize_t i, n, op_index = 0
+    cdef double left, right
+
+    try:
+        data = expr.encode('ascii')
+    except UnicodeEncodeError:
+        return None
+    s = data
+    n = len(data)
+
+    for i in range(1, n):
+        op = s[i]
+        if op == c'+' or op == c'-' or op == c'*' or op == c'/':
+            op_index = i
+            break
+    if op_index == 0:
+        return None
+    if not _is_number(s, 0, op_index) or not _is_number(s, op_index + 1, n):
+        return None
+
+    op = s[op_index]
+    left = strtod(s, &end)
+    right = strtod(s + op_index + 1, &end)
+
+    if op == c'+':
+        return left + right
+    if op == c'-':
+        return left - right
+    if op == c'*':
+        return left * right
+    if right == 0:
+        raise ZeroDivisionError("Division by zero")
+    return left / right
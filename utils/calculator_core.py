@@ -1,59 +1,222 @@
+import functools
 import re
 import operator
 from typing import Union
 
-class Calculator:
-    def __init__(self):
-        self.operators = {
-            '+': operator.add,
-            '-': operator.sub,
-            '*': operator.mul,
-            '/': operator.truediv
-        }
-    
-    def evaluate(self, expression: str) -> Union[float, int]:
-        """Evaluate mathematical expression"""
-        # Remove whitespace
-        expression = expression.replace(' ', '')
-        
-        # Basic validation
-        if not expression:
-            raise ValueError("Empty expression")
-        
-        # Handle simple expressions (number operator number)
-        pattern = r'^(\d*\.?\d+)\s*([+\-*/])\s*(\d*\.?\d+)$'
-        match = re.match(pattern, expression)
-        
-        if match:
-            left_operand = float(match.group(1))
-            operator_symbol = match.group(2)
-            right_operand = float(match.group(3))
-            
-            if operator_symbol not in self.operators:
-                raise ValueError(f"Unsupported operator: {operator_symbol}")
-            
-            if operator_symbol == '/' and right_operand == 0:
-                raise ZeroDivisionError("Division by zero")
-            
-            result = self.operators[operator_symbol](left_operand, right_operand)
-            
+try:
+    # Optional C accelerator; see utils/_calculator_core.pyx for the
+    # build command
+    from utils._calculator_core import evaluate_simple as _evaluate_simple_c
+except ImportError:
+    _evaluate_simple_c = None
+
+_OPS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv
+}
+_OP_SET = frozenset('+-*/')
+_SIMPLE_RE = re.compile(r'^(\d*\.?\d+)([+\-*/])(\d*\.?\d+)$')
+
+# Opcodes for the RPN programs produced by _tokenize
+_PUSH, _ADD, _SUB, _MUL, _DIV, _NEG = 0, 1, 2, 3, 4, 5
+_BINOP_CODE = {'+': _ADD, '-': _SUB, '*': _MUL, '/': _DIV}
+_OP_CODE = dict(_BINOP_CODE, u=_NEG)
+_PRECEDENCE = {'+': 1, '-': 1, '*': 2, '/': 2, 'u': 3}
+
+@functools.lru_cache(maxsize=1024)
+def _tokenize(expression):
+    """Compile an infix expression into an RPN program.
+
+    Returns (ops, nums): `ops` is the opcode sequence and `nums` holds
+    the operands consumed, in order, by the _PUSH opcodes. Raises
+    ValueError on malformed input.
+
+    Programs are memoized per expression, so re-running a complex
+    expression (including ones that fail at execution time, e.g.
+    division by zero, which the result cache never stores) skips
+    parsing entirely.
+    """
+    ops = []
+    nums = []
+    stack = []
+    i = 0
+    n = len(expression)
+    prev = ''  # one of '', 'num', 'op', '(', ')'
+    while i < n:
+        ch = expression[i]
+        if ch.isdigit() or ch == '.':
+            if prev in ('num', ')'):
+                raise ValueError("Invalid expression format")
+            j = i + 1
+            while j < n and (expression[j].isdigit() or expression[j] == '.'):
+                j += 1
+            try:
+                value = float(expression[i:j])
+            except ValueError:
+                raise ValueError("Invalid expression format")
+            ops.append(_PUSH)
+            nums.append(value)
+            prev = 'num'
+            i = j
+        elif ch == '(':
+            if prev in ('num', ')'):
+                raise ValueError("Invalid expression format")
+            stack.append('(')
+            prev = '('
+            i += 1
+        elif ch == ')':
+            if prev not in ('num', ')'):
+                raise ValueError("Invalid expression format")
+            while stack and stack[-1] != '(':
+                ops.append(_OP_CODE[stack.pop()])
+            if not stack:
+                raise ValueError("Invalid expression format")
+            stack.pop()
+            prev = ')'
+            i += 1
+        elif ch in _OP_SET:
+            if ch == '-' and prev in ('', 'op', '('):
+                op = 'u'  # unary minus
+            else:
+                if prev not in ('num', ')'):
+                    raise ValueError("Invalid expression format")
+                op = ch
+            # Unary minus is right-associative, binary operators are
+            # left-associative
+            while stack and stack[-1] != '(' and (
+                _PRECEDENCE[stack[-1]] > _PRECEDENCE[op]
+                or (_PRECEDENCE[stack[-1]] == _PRECEDENCE[op] and op != 'u')
+            ):
+                ops.append(_OP_CODE[stack.pop()])
+            stack.append(op)
+            prev = 'op'
+            i += 1
+        else:
+            raise ValueError("Expression contains invalid characters")
+
+    if prev not in ('num', ')'):
+        raise ValueError("Invalid expression format")
+    while stack:
+        top = stack.pop()
+        if top == '(':
+            raise ValueError("Invalid expression format")
+        ops.append(_OP_CODE[top])
+    # Tuples so the cached program is immutable
+    return tuple(ops), tuple(nums)
+
+def _rpn_eval(ops, nums):
+    """Execute an RPN program produced by _tokenize"""
+    stack = []
+    k = 0
+    for code in ops:
+        if code == _PUSH:
+            stack.append(nums[k])
+            k += 1
+        elif code == _NEG:
+            stack[-1] = -stack[-1]
+        else:
+            right = stack.pop()
+            if code == _ADD:
+                stack[-1] = stack[-1] + right
+            elif code == _SUB:
+                stack[-1] = stack[-1] - right
+            elif code == _MUL:
+                stack[-1] = stack[-1] * right
+            else:
+                if right == 0:
+                    raise ZeroDivisionError("Division by zero")
+                stack[-1] = stack[-1] / right
+    if len(stack) != 1:
+        raise ValueError("Invalid expression format")
+    return stack[0]
+
+def _is_number(token: str) -> bool:
+    """Check that a token matches \\d*\\.?\\d+ without the regex engine"""
+    if not token or not token[-1].isdigit():
+        return False
+    seen_dot = False
+    for ch in token:
+        if ch == '.':
+            if seen_dot:
+                return False
+            seen_dot = True
+        elif not ch.isdigit():
+            return False
+    return True
+
+def _apply(operator_symbol: str, left_operand: float, right_operand: float) -> Union[float, int]:
+    """Apply a binary operator to two operands"""
+    if operator_symbol == '/' and right_operand == 0:
+        raise ZeroDivisionError("Division by zero")
+
+    result = _OPS[operator_symbol](left_operand, right_operand)
+
+    # Return int if result is whole number
+    return int(result) if result.is_integer() else round(result, 10)
+
+def _safe_eval(expression: str) -> Union[float, int]:
+    """Evaluate a complex expression via its compiled RPN program"""
+    ops, nums = _tokenize(expression)
+    result = _rpn_eval(ops, nums)
+
+    # Return int if result is whole number
+    return int(result) if result.is_integer() else round(result, 10)
+
+@functools.lru_cache(maxsize=4096)
+def _evaluate_cached(expression: str) -> Union[float, int]:
+    """Evaluate a whitespace-normalized expression (memoized).
+
+    Repeated expressions (users pressing '=' twice, refreshing clients)
+    resolve with a dict lookup instead of re-parsing.
+    """
+    # Basic validation
+    if not expression:
+        raise ValueError("Empty expression")
+
+    if _evaluate_simple_c is not None:
+        result = _evaluate_simple_c(expression)
+        if result is not None:
             # Return int if result is whole number
             return int(result) if result.is_integer() else round(result, 10)
-        
-        # For more complex expressions, use safe evaluation
-        return self._safe_eval(expression)
-    
-    def _safe_eval(self, expression: str) -> float:
-        """Safely evaluate expression using restricted evaluation"""
-        # Only allow numbers, basic operators, and parentheses
-        if not re.match(r'^[\d+\-*/.()\s]+$', expression):
-            raise ValueError("Expression contains invalid characters")
-        
-        # Replace operator symbols with lambda functions
-        # This is a simplified approach - in production, use a proper expression parser
-        try:
-            # Use eval with restricted locals (still not recommended for production)
-            allowed_globals = {"__builtins__": {}}
-            return eval(expression, allowed_globals, {})
-        except:
-            raise ValueError("Invalid expression format")
\ No newline at end of file
+
+    # Fast path: find the operator of a "number op number" expression
+    # with a single linear scan instead of running the regex engine
+    op_index = 0
+    for i in range(1, len(expression)):
+        if expression[i] in _OP_SET:
+            op_index = i
+            break
+
+    if op_index:
+        left = expression[:op_index]
+        right = expression[op_index + 1:]
+        if _is_number(left) and _is_number(right):
+            return _apply(expression[op_index], float(left), float(right))
+
+    # Ambiguous cases (e.g. leading '-') fall back to the precompiled
+    # pattern before handing off to full evaluation
+    match = _SIMPLE_RE.match(expression)
+    if match:
+        return _apply(match.group(2), float(match.group(1)), float(match.group(3)))
+
+    # For more complex expressions, use safe evaluation
+    return _safe_eval(expression)
+
+def evaluate(expression: str, normalized: bool = False) -> Union[float, int]:
+    """Evaluate mathematical expression.
+
+    Pass normalized=True when the expression is already whitespace-free
+    (e.g. returned by validate_expression) to skip renormalization.
+    """
+    if not normalized:
+        expression = expression.replace(' ', '')
+    return _evaluate_cached(expression)
+
+class Calculator:
+    """Stateless wrapper kept for backwards compatibility; prefer the
+    module-level evaluate()"""
+
+    def evaluate(self, expression: str) -> Union[float, int]:
+        return evaluate(expression)
@@ -0,0 +1,89 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class CalculationWriter:
+    """Write-behind queue that batches Calculation inserts.
+
+    Instead of paying one transaction (and one fsync) per request, the
+    /calculate route enqueues rows here and a background thread flushes
+    them in batches of up to `batch_size` rows or every `flush_interval`
+    seconds, whichever comes first.
+    """
+
+    def __init__(self, app, db, batch_size=100, flush_interval=0.05):
+        self._app = app
+        self._db = db
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def enqueue(self, calculation):
+        """Queue a calculation for background insertion.
+
+        Under TESTING the write happens inline so tests can read their
+        own writes immediately after the request returns.
+        """
+        if self._app.config.get('TESTING'):
+            self._db.session.add(calculation)
+            self._db.session.commit()
+            return
+        self._ensure_thread()
+        self._queue.put(calculation)
+
+    def _ensure_thread(self):
+        # Started lazily on the first real write so TESTING apps (which
+        # commit inline) never leak an idle thread per create_app()
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    thread = threading.Thread(target=self._run, daemon=True)
+                    thread.start()
+                    atexit.register(self._drain)
+                    self._thread = thread
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _drain(self):
+        """Flush whatever is still queued at interpreter shutdown, so a
+        graceful worker recycle doesn't drop acknowledged writes."""
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._flush(batch)
+
+    def _flush(self, batch):
+        with self._app.app_context():
+            try:
+                self._db.session.bulk_save_objects(batch)
+                self._db.session.commit()
+            except Exception:
+                # Roll back and drop the batch: requeueing a poison batch
+                # would retry it forever and block every later write. One
+                # failed flush must not kill the worker loop.
+                self._db.session.rollback()
+                logger.exception(
+                    'Dropping batch of %d calculations after failed flush',
+                    len(batch))
@@ -1,50 +1,90 @@
 import re
 
-def validate_expression(expression: str) -> bool:
-    """Validate calculator expression"""
-    if not expression or not isinstance(expression, str):
-        return False
-    
-    # Remove whitespace
-    expression = expression.strip()
-    
-    # Check for valid characters (numbers, operators, decimal points, parentheses)
-    if not re.match(r'^[\d+\-*/.()\s]+$', expression):
-        return False
-    
-    # Basic syntax validation
-    if _has_invalid_syntax(expression):
-        return False
-    
-    return True
+# Compiled once at import so per-call work skips the re module's cache
+# lookup entirely
+_SANITIZE_RE = re.compile(r'[^0-9+\-*/.()\s]')
+
+_WHITESPACE = frozenset(' \t\n\r\v\f')
+
+def _build_valid_table():
+    table = [False] * 128
+    for ch in '0123456789+-*/.()':
+        table[ord(ch)] = True
+    for ch in _WHITESPACE:
+        table[ord(ch)] = True
+    return tuple(table)
+
+# 128-entry lookup table for the allowed character class
+_VALID_BYTES = _build_valid_table()
+
+def validate_expression(expression: str):
+    """Validate calculator expression.
+
+    Returns (is_valid, normalized): `normalized` is the whitespace-free
+    form of the expression, ready to hand to evaluate() without another
+    normalization pass, or None when the expression is invalid.
+    """
+    if not isinstance(expression, str):
+        return False, None
+
+    # Reject empty/whitespace-only input before any scanning work
+    normalized = ''.join(expression.split())
+    if not normalized:
+        return False, None
+
+    if _has_invalid_syntax(normalized):
+        return False, None
+
+    return True, normalized
 
 def _has_invalid_syntax(expression: str) -> bool:
-    """Check for basic syntax errors"""
-    # Remove spaces
-    expression = expression.replace(' ', '')
-    
-    # Check for consecutive operators (except negative numbers)
-    operator_pattern = r'[+\*/]{2,}|--+(?!\d)|-{2,}(?=\d)'
-    if re.search(operator_pattern, expression):
-        return True
-    
-    # Check for operators at start/end (except negative at start)
-    if expression[0] in '+*/' or expression[-1] in '+*/-':
-        return True
-    
-    # Check for multiple decimal points in numbers
-    decimal_pattern = r'\d*\.\d*\.\d*'
-    if re.search(decimal_pattern, expression):
-        return True
-    
-    # Check for unmatched parentheses
-    if expression.count('(') != expression.count(')'):
-        return True
-    
-    return False
+    """Check character class and basic syntax errors in a single pass.
+
+    One scan tracks parenthesis depth, consecutive operators, decimal
+    points per number, and the allowed character class, instead of the
+    separate regex/count passes it replaces.
+    """
+    depth = 0
+    prev = ''   # previous significant (non-whitespace) character
+    first = ''  # first significant character
+    dot_in_number = False
+    for ch in expression:
+        code = ord(ch)
+        if code >= 128 or not _VALID_BYTES[code]:
+            return True
+        if ch in _WHITESPACE:
+            continue
+        if not first:
+            first = ch
+        if ch == '.':
+            # Two decimal points with only digits between them
+            if dot_in_number:
+                return True
+            dot_in_number = True
+        elif not ch.isdigit():
+            dot_in_number = False
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+            if depth < 0:
+                return True
+        elif prev and ((prev in '+*/' and ch in '+*/') or
+                       (prev == '-' and ch == '-')):
+            # Consecutive operators (a single '-' after an operator is a
+            # negative number)
+            return True
+        prev = ch
+
+    if not prev:
+        return True  # empty or whitespace-only
+
+    # Operators at start/end (except negative at start) and unmatched
+    # parentheses
+    return first in '+*/' or prev in '+*/-' or depth != 0
 
 def sanitize_expression(expression: str) -> str:
     """Sanitize expression for safe processing"""
     # Remove potentially dangerous characters
-    expression = re.sub(r'[^0-9+\-*/.()\s]', '', expression)
-    return expression.strip()
\ No newline at end of file
+    expression = _SANITIZE_RE.sub('', expression)
+    return expression.strip()
@@ -0,0 +1,12 @@
+"""WSGI entrypoint for production servers.
+
+Run with e.g.:
+
+    gunicorn -w 4 -k gthread --threads 4 -b 0.0.0.0:5000 wsgi:application
+
+SQLite runs in WAL mode (see app.py), which is required for concurrent
+writes across multiple workers.
+"""
+from app import create_app
+
+application = create_app()